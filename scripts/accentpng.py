@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
-"""Generate a minimal two-color PNG with an accent square flush top-left."""
+"""Generate a minimal two-color PNG with an accent square flush top-left.
+
+If main and accent are the same color the image is a flat fill and is
+written through solidpng's single-entry path (see palette.py).
+"""
 
 import argparse
-import math
 import struct
 import sys
 import zlib
 
+from palette import pack_row, plan_palette, plte
+from solidpng import make_png as make_solid_png
+
 
 def chunk(ctype: bytes, data: bytes) -> bytes:
     c = ctype + data
@@ -33,35 +39,27 @@ def make_png(
     main: tuple[int, int, int],
     accent: tuple[int, int, int],
     square: int,
+    minimize: bool = True,
 ) -> bytes:
-    sig = b"\x89PNG\r\n\x1a\n"
-    ihdr = struct.pack(">IIBBBBB", w, h, 1, 3, 0, 0, 0)
-    plte = bytes([*accent, *main])
-
-    row_bytes = math.ceil(w / 8)
-
     if square <= 0 or square > w or square > h:
         raise ValueError(f"square size {square} out of range for {w}x{h}")
 
-    full_accent_bytes = square // 8
-    leftover_bits = square % 8
+    plan = plan_palette([main, accent], minimize)
+    if len(plan.colors) == 1:
+        return make_solid_png(w, h, *plan.colors[0])
 
-    accent_row = bytearray(row_bytes)
-    for i in range(row_bytes):
-        if i < full_accent_bytes:
-            accent_row[i] = 0x00
-        elif i == full_accent_bytes and leftover_bits > 0:
-            accent_row[i] = (0xFF >> leftover_bits)
-        else:
-            accent_row[i] = 0xFF
+    sig = b"\x89PNG\r\n\x1a\n"
+    ihdr = struct.pack(">IIBBBBB", w, h, plan.bit_depth, 3, 0, 0, 0)
 
-    main_row = b"\xFF" * row_bytes
+    main_idx, accent_idx = plan.index
+    accent_row = pack_row([accent_idx] * square + [main_idx] * (w - square), plan.bit_depth)
+    main_row = pack_row([main_idx] * w, plan.bit_depth)
 
     rows = []
     for y in range(h):
         rows.append(b"\x00")
         if y < square:
-            rows.append(bytes(accent_row))
+            rows.append(accent_row)
         else:
             rows.append(main_row)
 
@@ -70,7 +68,7 @@ def make_png(
     return (
         sig
         + chunk(b"IHDR", ihdr)
-        + chunk(b"PLTE", plte)
+        + chunk(b"PLTE", plte(plan))
         + chunk(b"IDAT", compressed)
         + chunk(b"IEND", b"")
     )
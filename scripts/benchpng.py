@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark palette minimization across the PNG generators.
+
+Each case encodes the same image twice: once with one palette entry per
+color role (minimize=False, the fixed layout the generators used before
+palette.plan_palette()), and once with the planned palette. The table
+reports bit depth, file size, and best-of-N encode time for both.
+
+Cases cover every way the role colors can collide: all distinct,
+main == accent, grid == background, grid == accent, and all equal.
+"""
+
+import argparse
+import time
+
+from accentpng import make_png as make_accent_png
+from gridpng import grid_layout, make_png_grid, make_png_no_grid
+from palette import plan_palette
+from solidpng import parse_color, parse_dims
+
+WHITE = parse_color("ffffff")
+BLACK = parse_color("000000")
+BLUE = parse_color("2563eb")
+ORANGE = parse_color("f97316")
+GRAY = parse_color("aaaaaa")
+
+
+def cases(w: int, h: int, cell: int) -> list[tuple[str, list, object]]:
+    """Return (label, role colors, encoder(minimize) -> bytes) triples."""
+    full_cols, h_margin, full_rows, v_margin = grid_layout(w, h, cell)
+    ax = h_margin + (full_cols // 2) * cell
+    ay = v_margin + (full_rows // 2) * cell
+    square = min(cell, w, h)
+
+    def accent(main, acc):
+        return lambda m: make_accent_png(w, h, main, acc, square, m)
+
+    def no_grid(main, acc):
+        return lambda m: make_png_no_grid(w, h, main, acc, cell, ax, ay, m)
+
+    def grid(main, acc, g):
+        return lambda m: make_png_grid(w, h, main, acc, cell, ax, ay, g, m)
+
+    return [
+        ("accentpng distinct", [WHITE, BLUE], accent(WHITE, BLUE)),
+        ("accentpng main=accent", [BLUE, BLUE], accent(BLUE, BLUE)),
+        ("gridpng no-grid distinct", [WHITE, BLUE], no_grid(WHITE, BLUE)),
+        ("gridpng no-grid main=accent", [BLACK, BLACK], no_grid(BLACK, BLACK)),
+        ("gridpng grid distinct", [BLACK, GRAY, ORANGE], grid(BLACK, ORANGE, GRAY)),
+        ("gridpng grid=main", [BLACK, BLACK, ORANGE], grid(BLACK, ORANGE, BLACK)),
+        ("gridpng grid=accent", [BLACK, ORANGE, ORANGE], grid(BLACK, ORANGE, ORANGE)),
+        ("gridpng main=accent", [WHITE, GRAY, WHITE], grid(WHITE, WHITE, GRAY)),
+        ("gridpng all equal", [WHITE, WHITE, WHITE], grid(WHITE, WHITE, WHITE)),
+    ]
+
+
+def best_time(fn, minimize: bool, repeat: int) -> tuple[float, int]:
+    """Return (best seconds, output size) over `repeat` encodes."""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        data = fn(minimize)
+        best = min(best, time.perf_counter() - t0)
+        size = len(data)
+    return best, size
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark palette minimization.")
+    p.add_argument("--dims", default="2048x2048", help="image dimensions as WxH (default: 2048x2048)")
+    p.add_argument("--cell", type=int, default=90, help="grid cell size in pixels (default: 90)")
+    p.add_argument("--repeat", type=int, default=5, help="encodes per measurement (default: 5)")
+    args = p.parse_args()
+
+    w, h = parse_dims(args.dims)
+    print(f"{w}x{h} cell={args.cell}px best of {args.repeat}\n")
+    print(
+        f"{'case':<30} {'depth':<10}{'bytes':>16} {'size':>6} "
+        f"{'ms':>17} {'time':>6}"
+    )
+
+    for label, roles, fn in cases(w, h, args.cell):
+        fixed = plan_palette(roles, minimize=False)
+        planned = plan_palette(roles)
+        planned_depth = "solid" if len(planned.colors) == 1 else str(planned.bit_depth)
+
+        t_fixed, n_fixed = best_time(fn, False, args.repeat)
+        t_planned, n_planned = best_time(fn, True, args.repeat)
+
+        print(
+            f"{label:<30} {fixed.bit_depth:>2} -> {planned_depth:<5}"
+            f"{n_fixed:>7} -> {n_planned:<5} {1 - n_planned / n_fixed:>6.1%} "
+            f"{t_fixed * 1e3:>7.1f} -> {t_planned * 1e3:<6.1f} {1 - t_planned / t_fixed:>6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,17 +22,27 @@ Brand usage: both inherent.design (blue #2563eb on white) and cfgate
 
 Palette minimization
 --------------------
-Without grid lines, only two colors exist (accent + background), so the
-image uses a 1-bit indexed palette (bit depth 1, color type 3). Each
-scanline packs 8 pixels per byte. A 2048x2048 image stores 256 bytes
-per row instead of 6144 for RGB.
-
-With grid lines, three colors exist (accent + background + grid), so the
-image uses a 2-bit indexed palette (bit depth 2, color type 3). Each
-scanline packs 4 pixels per byte. The PLTE chunk is 9 bytes total.
-
-Indexed color keeps the palette to the theoretical minimum: no unused
-entries, no alpha channel, no wasted bit depth.
+Palette layout is planned by palette.plan_palette() from the role colors
+(background, then grid, then accent) rather than from the --render-grid
+flag alone. Duplicate colors collapse onto one entry, and the bit depth
+is the smallest that holds the distinct entries:
+
+    distinct colors   bit depth   pixels per byte
+    1                 (solid)     handled by solidpng.make_png()
+    2                 1           8
+    3-4               2           4
+
+Without grid lines, two colors exist (background + accent), giving a
+1-bit indexed palette. A 2048x2048 image stores 256 bytes per row
+instead of 6144 for RGB. With grid lines, three colors exist and the
+image uses 2 bits per pixel; if the grid color matches the background
+or the accent, the image drops back to 1 bit. If every role resolves to
+the same color, the output is identical to solidpng's.
+
+The background always takes index 0, so background scanlines are
+all-zero bytes and only accent/grid pixels set bits. Indexed color keeps
+the palette to the theoretical minimum: no unused or duplicate entries,
+no alpha channel, no wasted bit depth.
 
 Compression
 -----------
@@ -45,10 +55,12 @@ repetition that LZ77 collapses. A 2048x2048 icon compresses to ~2.4 KB.
 """
 
 import argparse
-import math
 import struct
 import zlib
 
+from palette import PalettePlan, pack_row, plan_palette, plte
+from solidpng import make_png as make_solid_png
+
 
 def chunk(ctype: bytes, data: bytes) -> bytes:
     """Build a PNG chunk: length + type + data + CRC32."""
@@ -91,113 +103,109 @@ def grid_layout(w: int, h: int, cell: int) -> tuple[int, int, int, int]:
     return full_cols, h_margin, full_rows, v_margin
 
 
-def pack_2bit(pixels: list[int], row_bytes: int) -> bytes:
-    """Pack a list of 2-bit palette indices into bytes (MSB first)."""
-    row = bytearray(row_bytes)
-    for i, idx in enumerate(pixels):
-        byte_pos = i // 4
-        shift = 6 - (i % 4) * 2
-        row[byte_pos] |= (idx & 0x03) << shift
-    return bytes(row)
+def grid_lines(w: int, h: int, cell: int) -> tuple[set[int], set[int]]:
+    """Compute grid line positions as (h_lines, v_lines).
+
+    Lines are 2px wide at each cell boundary (y-1 and y for horizontal,
+    x-1 and x for vertical). Boundaries sit at margin + n * cell for n in
+    0..full_rows inclusive, so the edges get lines too.
+    """
+    full_cols, h_margin, full_rows, v_margin = grid_layout(w, h, cell)
+
+    h_lines: set[int] = set()
+    for r in range(full_rows + 1):
+        y = v_margin + r * cell
+        if 0 < y < h:
+            h_lines.add(y - 1)
+        if 0 <= y < h:
+            h_lines.add(y)
+
+    v_lines: set[int] = set()
+    for c in range(full_cols + 1):
+        x = h_margin + c * cell
+        if 0 < x < w:
+            v_lines.add(x - 1)
+        if 0 <= x < w:
+            v_lines.add(x)
+
+    return h_lines, v_lines
+
+
+def encode_png(w: int, h: int, plan: PalettePlan, scanlines: bytes) -> bytes:
+    """Assemble an indexed PNG from a palette plan and filtered scanlines."""
+    sig = b"\x89PNG\r\n\x1a\n"
+    ihdr = struct.pack(">IIBBBBB", w, h, plan.bit_depth, 3, 0, 0, 0)
+    compressed = zlib.compress(scanlines, 9)
+    return (
+        sig
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"PLTE", plte(plan))
+        + chunk(b"IDAT", compressed)
+        + chunk(b"IEND", b"")
+    )
 
 
-# -- No-grid path: 1-bit indexed (2-color PLTE) ------------------------------
+# -- No-grid path: background + accent -----------------------------------------
 
 def make_png_no_grid(
     w: int, h: int, main: tuple[int, int, int], accent: tuple[int, int, int],
-    cell: int, ax: int, ay: int,
+    cell: int, ax: int, ay: int, minimize: bool = True,
 ) -> bytes:
-    """Generate a 1-bit indexed PNG with two colors: accent (index 0) and
-    background (index 1). Bit depth 1 packs 8 pixels per byte, giving
-    maximum compression for images with only two distinct colors.
+    """Generate an indexed PNG with background and accent roles. Two
+    distinct colors give bit depth 1 (8 pixels per byte); a single color
+    falls back to solidpng.
     """
-    sig = b"\x89PNG\r\n\x1a\n"
-    ihdr = struct.pack(">IIBBBBB", w, h, 1, 3, 0, 0, 0)  # 1-bit indexed
-    plte = bytes([*accent, *main])  # 2 entries, 6 bytes
-
-    row_bytes = math.ceil(w / 8)
-
-    # Precompute the accent row: index 0 where accent cell is, index 1 elsewhere.
-    # Index 1 = bit set, index 0 = bit clear (palette order).
-    accent_row = bytearray(row_bytes)
-    for i in range(row_bytes):
-        byte_val = 0
-        for bit in range(8):
-            x = i * 8 + bit
-            if x >= w:
-                break
-            if not (ax <= x < ax + cell):
-                byte_val |= 1 << (7 - bit)
-        accent_row[i] = byte_val
-
-    # Background row: all index 1 (all bits set).
-    main_row = b"\xFF" * row_bytes
+    plan = plan_palette([main, accent], minimize)
+    if len(plan.colors) == 1:
+        return make_solid_png(w, h, *plan.colors[0])
+    main_idx, accent_idx = plan.index
+
+    # Only 2 distinct row patterns: accent row and background row.
+    accent_row = pack_row(
+        [accent_idx if ax <= x < ax + cell else main_idx for x in range(w)],
+        plan.bit_depth,
+    )
+    main_row = pack_row([main_idx] * w, plan.bit_depth)
 
     # Build scanlines. Filter byte 0x00 (None) preserves raw bytes for
     # optimal zlib repetition detection across identical rows.
     parts = []
     for y in range(h):
         parts.append(b"\x00")
-        parts.append(bytes(accent_row) if ay <= y < ay + cell else main_row)
+        parts.append(accent_row if ay <= y < ay + cell else main_row)
 
-    compressed = zlib.compress(b"".join(parts), 9)
-    return (
-        sig
-        + chunk(b"IHDR", ihdr)
-        + chunk(b"PLTE", plte)
-        + chunk(b"IDAT", compressed)
-        + chunk(b"IEND", b"")
-    )
+    return encode_png(w, h, plan, b"".join(parts))
 
 
-# -- Grid path: 2-bit indexed (3-color PLTE) ---------------------------------
+# -- Grid path: background + grid + accent -------------------------------------
 
 def make_png_grid(
     w: int, h: int, main: tuple[int, int, int], accent: tuple[int, int, int],
     cell: int, ax: int, ay: int, grid_rgb: tuple[int, int, int],
+    minimize: bool = True,
 ) -> bytes:
-    """Generate a 2-bit indexed PNG with three colors: accent (index 0),
-    background (index 1), grid (index 2). Grid lines are 2px wide,
-    straddling each cell boundary (1px on each side).
+    """Generate an indexed PNG with background, grid, and accent roles.
+    Grid lines are 2px wide, straddling each cell boundary (1px on each
+    side). Three distinct colors give bit depth 2; collapsed palettes drop
+    to bit depth 1 or the solidpng path.
     """
-    sig = b"\x89PNG\r\n\x1a\n"
-    ihdr = struct.pack(">IIBBBBB", w, h, 2, 3, 0, 0, 0)  # 2-bit indexed
-    plte = bytes([*accent, *main, *grid_rgb])  # 3 entries, 9 bytes
-
-    full_cols, h_margin, full_rows, v_margin = grid_layout(w, h, cell)
-    row_bytes = math.ceil(w * 2 / 8)
-
-    # Grid lines at cell boundaries, 2px wide (y-1 and y for horizontal,
-    # x-1 and x for vertical). Boundaries at margin + n * cell for
-    # n in 0..full_rows (inclusive, so edges get lines too).
-    h_lines: set[int] = set()
-    for r in range(full_rows + 1):
-        y = v_margin + r * cell
-        if 0 < y < h:
-            h_lines.add(y - 1)
-        if 0 <= y < h:
-            h_lines.add(y)
+    plan = plan_palette([main, grid_rgb, accent], minimize)
+    if len(plan.colors) == 1:
+        return make_solid_png(w, h, *plan.colors[0])
+    main_idx, grid_idx, accent_idx = plan.index
 
-    v_lines: set[int] = set()
-    for c in range(full_cols + 1):
-        x = h_margin + c * cell
-        if 0 < x < w:
-            v_lines.add(x - 1)
-        if 0 <= x < w:
-            v_lines.add(x)
+    h_lines, v_lines = grid_lines(w, h, cell)
 
     # Only 4 distinct row patterns exist (accent-y/grid-y cross product).
     # Precompute all 4 and select per-scanline for zlib to collapse.
     def build_row(in_accent_y: bool, on_hline: bool) -> bytes:
-        pixels = [0] * w
+        pixels = [main_idx] * w
         for x in range(w):
             if in_accent_y and ax <= x < ax + cell:
-                pixels[x] = 0  # accent always wins over grid
+                pixels[x] = accent_idx  # accent always wins over grid
             elif on_hline or x in v_lines:
-                pixels[x] = 2  # grid line
-            else:
-                pixels[x] = 1  # background
-        return pack_2bit(pixels, row_bytes)
+                pixels[x] = grid_idx
+        return pack_row(pixels, plan.bit_depth)
 
     row_a = build_row(True, False)   # accent row, no grid line
     row_b = build_row(True, True)    # accent row, on grid line
@@ -218,14 +226,7 @@ def make_png_grid(
         else:
             parts.append(row_c)
 
-    compressed = zlib.compress(b"".join(parts), 9)
-    return (
-        sig
-        + chunk(b"IHDR", ihdr)
-        + chunk(b"PLTE", plte)
-        + chunk(b"IDAT", compressed)
-        + chunk(b"IEND", b"")
-    )
+    return encode_png(w, h, plan, b"".join(parts))
 
 
 def main() -> None:
@@ -0,0 +1,87 @@
+"""Shared palette planning for the indexed PNG generators.
+
+solidpng, accentpng, and gridpng all describe an image as a small set of
+color roles (background, accent, grid) painted onto a canvas. The roles
+are arbitrary user input, so two of them can resolve to the same RGB
+value: main == accent, grid == background, grid == accent. Writing one
+palette entry per role in that case wastes PLTE bytes and, worse, can
+force a higher bit depth than the image actually needs.
+
+Planning
+--------
+plan_palette() takes the role colors in descending order of pixel
+coverage (background first) and returns a PalettePlan:
+
+    colors     distinct RGB entries, in palette order
+    index      palette index for each input role
+    bit_depth  smallest legal indexed depth (1, 2, 4, 8) for len(colors)
+
+Duplicate colors collapse onto the entry of their first occurrence. The
+dominant role always lands on index 0, so background scanlines pack to
+all-zero bytes: the same row solidpng writes, and the cheapest pattern
+for deflate. Minority roles only set bits where they actually appear.
+
+A plan with a single entry means the image is one flat color; callers
+hand it to solidpng.make_png() rather than encoding a degenerate layout.
+"""
+
+import math
+from typing import NamedTuple
+
+RGB = tuple[int, int, int]
+
+# Legal bit depths for PNG color type 3 (indexed).
+BIT_DEPTHS = (1, 2, 4, 8)
+
+
+class PalettePlan(NamedTuple):
+    colors: tuple[RGB, ...]
+    index: tuple[int, ...]
+    bit_depth: int
+
+
+def plan_palette(roles: list[RGB], minimize: bool = True) -> PalettePlan:
+    """Collapse duplicate role colors and pick the smallest bit depth.
+
+    With minimize=False every role keeps its own entry in input order,
+    which reproduces the fixed one-entry-per-role layout (used by the
+    benchmark as a baseline).
+    """
+    if not roles:
+        raise ValueError("palette needs at least one color")
+
+    colors: list[RGB] = []
+    index: list[int] = []
+    for rgb in roles:
+        if minimize and rgb in colors:
+            index.append(colors.index(rgb))
+        else:
+            index.append(len(colors))
+            colors.append(rgb)
+
+    for depth in BIT_DEPTHS:
+        if len(colors) <= 1 << depth:
+            return PalettePlan(tuple(colors), tuple(index), depth)
+    raise ValueError(f"{len(colors)} colors exceed the 256-entry indexed palette")
+
+
+def plte(plan: PalettePlan) -> bytes:
+    """Serialize the planned palette as PLTE chunk data (3 bytes/entry)."""
+    return bytes(c for rgb in plan.colors for c in rgb)
+
+
+def row_bytes(w: int, bit_depth: int) -> int:
+    """Bytes per scanline (excluding the filter byte) at the given depth."""
+    return math.ceil(w * bit_depth / 8)
+
+
+def pack_row(pixels: list[int], bit_depth: int) -> bytes:
+    """Pack palette indices into bytes at the given depth (MSB first)."""
+    per_byte = 8 // bit_depth
+    mask = (1 << bit_depth) - 1
+    row = bytearray(row_bytes(len(pixels), bit_depth))
+    for i, idx in enumerate(pixels):
+        if idx:
+            shift = 8 - bit_depth * (i % per_byte + 1)
+            row[i // per_byte] |= (idx & mask) << shift
+    return bytes(row)
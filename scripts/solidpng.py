@@ -2,11 +2,12 @@
 """Generate a minimal solid-color PNG (indexed, 1-bit, single-entry palette)."""
 
 import argparse
-import math
 import struct
 import sys
 import zlib
 
+from palette import plan_palette, plte, row_bytes
+
 
 def chunk(ctype: bytes, data: bytes) -> bytes:
     c = ctype + data
@@ -28,16 +29,15 @@ def parse_dims(s: str) -> tuple[int, int]:
 
 
 def make_png(w: int, h: int, r: int, g: int, b: int) -> bytes:
+    plan = plan_palette([(r, g, b)])
     sig = b"\x89PNG\r\n\x1a\n"
-    ihdr = struct.pack(">IIBBBBB", w, h, 1, 3, 0, 0, 0)
-    plte = bytes([r, g, b])
-    row_bytes = math.ceil(w / 8)
-    row = b"\x00" + b"\x00" * row_bytes
+    ihdr = struct.pack(">IIBBBBB", w, h, plan.bit_depth, 3, 0, 0, 0)
+    row = b"\x00" + b"\x00" * row_bytes(w, plan.bit_depth)
     compressed = zlib.compress(row * h, 9)
     return (
         sig
         + chunk(b"IHDR", ihdr)
-        + chunk(b"PLTE", plte)
+        + chunk(b"PLTE", plte(plan))
         + chunk(b"IDAT", compressed)
         + chunk(b"IEND", b"")
     )